@@ -8,40 +8,73 @@ SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
 source "$SCRIPT_DIR/config.sh"
 
 
+# Function to rotate the log file once it grows past the configured limit
+rotate_log_if_needed() {
+    [[ -f "$CLAUDE_NOTIFICATIONS_LOG_FILE" ]] || return 0
+    
+    local line_count=$(wc -l < "$CLAUDE_NOTIFICATIONS_LOG_FILE" 2>/dev/null || echo 0)
+    if [[ $line_count -gt $CLAUDE_NOTIFICATIONS_MAX_LOG_LINES ]]; then
+        # Rotate: keep only the last KEEP_LOG_LINES lines
+        tail -n "$CLAUDE_NOTIFICATIONS_KEEP_LOG_LINES" "$CLAUDE_NOTIFICATIONS_LOG_FILE" > "$CLAUDE_NOTIFICATIONS_LOG_FILE.tmp" 2>/dev/null && \
+        mv "$CLAUDE_NOTIFICATIONS_LOG_FILE.tmp" "$CLAUDE_NOTIFICATIONS_LOG_FILE" 2>/dev/null
+        
+        # Add rotation marker
+        {
+            echo "=== LOG ROTATED $(date) ==="
+            echo "Trimmed log from $line_count to $CLAUDE_NOTIFICATIONS_KEEP_LOG_LINES lines"
+            echo ""
+        } >> "$CLAUDE_NOTIFICATIONS_LOG_FILE"
+    fi
+}
+
 # Function to log messages with timestamp and auto-rotation
 log_message() {
     local level="$1"
     shift
     
-    # Check if log rotation is needed before writing
-    if [[ -f "$CLAUDE_NOTIFICATIONS_LOG_FILE" ]]; then
-        local line_count=$(wc -l < "$CLAUDE_NOTIFICATIONS_LOG_FILE" 2>/dev/null || echo 0)
-        if [[ $line_count -gt $CLAUDE_NOTIFICATIONS_MAX_LOG_LINES ]]; then
-            # Rotate: keep only the last KEEP_LOG_LINES lines
-            tail -n "$CLAUDE_NOTIFICATIONS_KEEP_LOG_LINES" "$CLAUDE_NOTIFICATIONS_LOG_FILE" > "$CLAUDE_NOTIFICATIONS_LOG_FILE.tmp" 2>/dev/null && \
-            mv "$CLAUDE_NOTIFICATIONS_LOG_FILE.tmp" "$CLAUDE_NOTIFICATIONS_LOG_FILE" 2>/dev/null
-            
-            # Add rotation marker
-            {
-                echo "=== LOG ROTATED $(date) ==="
-                echo "Trimmed log from $line_count to $CLAUDE_NOTIFICATIONS_KEEP_LOG_LINES lines"
-                echo ""
-            } >> "$CLAUDE_NOTIFICATIONS_LOG_FILE"
-        fi
+    # A hook only writes a handful of records, so check rotation once per
+    # run rather than counting lines before every write
+    if [[ -z "$CLAUDE_NOTIFICATIONS_LOG_ROTATION_CHECKED" ]]; then
+        CLAUDE_NOTIFICATIONS_LOG_ROTATION_CHECKED=1
+        rotate_log_if_needed
     fi
     
-    # Write the actual log message
-    echo "=== $level $(date) ===" >> "$CLAUDE_NOTIFICATIONS_LOG_FILE"
-    echo "$@" >> "$CLAUDE_NOTIFICATIONS_LOG_FILE"
-    echo "" >> "$CLAUDE_NOTIFICATIONS_LOG_FILE"
+    # Write the actual log message as a single append
+    {
+        echo "=== $level $(date) ==="
+        echo "$@"
+        echo ""
+    } >> "$CLAUDE_NOTIFICATIONS_LOG_FILE"
+}
+
+# Function to log verbose diagnostics; skipped entirely unless debug logging is on
+log_debug() {
+    [[ "$CLAUDE_NOTIFICATIONS_DEBUG" == "true" ]] || return 0
+    log_message "$@"
 }
 
 # Function to detect the originating application by walking up process tree
 detect_originating_app() {
-    local current_pid=$$
+    # Snapshot the process table with a single ps call and walk it in-shell
+    # instead of forking ps for every ancestor (pid-indexed sparse arrays,
+    # since bash 3.2 on macOS has no associative arrays)
+    local -a parent_of name_of
+    local pid ppid comm
+    while read -r pid ppid comm; do
+        parent_of[$pid]="$ppid"
+        name_of[$pid]="$comm"
+    done < <(ps -Ao pid=,ppid=,comm= 2>/dev/null)
+    
+    # Start at the hook's parent: the hook shell itself is never an app
+    local current_pid=$PPID
+    local visited_pids=" "
     
     while [[ $current_pid -gt 1 ]]; do
-        local process_name=$(ps -o comm= -p "$current_pid" 2>/dev/null)
+        # Stop on a ppid cycle (e.g. pid reuse) instead of walking forever
+        [[ "$visited_pids" == *" $current_pid "* ]] && break
+        visited_pids="$visited_pids$current_pid "
+        
+        local process_name="${name_of[$current_pid]}"
         
         case "$process_name" in
             *"idea"*|*"IntelliJ"*) echo "idea"; return ;;
@@ -57,13 +90,40 @@ detect_originating_app() {
             *"Alacritty"*) echo "alacritty"; return ;;
         esac
         
-        current_pid=$(ps -o ppid= -p "$current_pid" 2>/dev/null | xargs)
+        current_pid="${parent_of[$current_pid]}"
         [[ -z "$current_pid" ]] && break
     done
     
     echo "unknown"
 }
 
+# Function to get the originating application, reusing a recent result for the same session
+get_originating_app() {
+    local session_id="$1"
+    local cache_file="$CLAUDE_NOTIFICATIONS_APP_CACHE_FILE"
+    local now=$(date +%s)
+    
+    # Cache holds a single "session_id timestamp app" line
+    if [[ -n "$session_id" && -f "$cache_file" ]]; then
+        local cached_session="" cached_time="" cached_app=""
+        read -r cached_session cached_time cached_app < "$cache_file"
+        if [[ "$cached_session" == "$session_id" && "$cached_time" =~ ^[0-9]+$ ]] && \
+           (( now - cached_time < CLAUDE_NOTIFICATIONS_APP_CACHE_TTL )); then
+            echo "$cached_app"
+            return
+        fi
+    fi
+    
+    local app=$(detect_originating_app)
+    
+    # Don't cache a failed detection so the next hook gets another try
+    if [[ -n "$session_id" && "$app" != "unknown" ]]; then
+        echo "$session_id $now $app" > "$cache_file" 2>/dev/null
+    fi
+    
+    echo "$app"
+}
+
 # Function to get bundle ID for common applications
 get_bundle_id() {
     local app_name="$1"
@@ -86,7 +146,17 @@ get_bundle_id() {
 
 # Function to get currently focused application
 get_focused_app() {
-    local app_name=$(lsappinfo list | grep ": (in front)" | sed 's/.*"\([^"]*\)".*/\1/')
+    # Ask for just the front app's name rather than listing every app;
+    # the reply is "LSDisplayName"="<name>", so keep the quoted value
+    local front_asn=$(lsappinfo front 2>/dev/null)
+    local app_name=""
+    if [[ -n "$front_asn" ]]; then
+        local name_info=$(lsappinfo info -only name "$front_asn" 2>/dev/null)
+        if [[ "$name_info" == *'"="'* ]]; then
+            app_name="${name_info#*\"=\"}"
+            app_name="${app_name%\"*}"
+        fi
+    fi
     [[ -z "$app_name" ]] && { echo "unknown"; return; }
     
     case "$app_name" in
@@ -109,9 +179,18 @@ extract_project_name() {
         return
     fi
     
-    local encoded_dir=$(basename "$(dirname "$transcript_path")")
-    local decoded_path=$(echo "$encoded_dir" | sed 's/-/\//g')
-    echo "$decoded_path" | sed 's|^/Users/[^/]*/||' | sed 's|^/||'
+    # Parameter expansion only: no dirname/basename/sed processes
+    local file_path="${transcript_path%/}"
+    local parent_dir="."
+    [[ "$file_path" == */* ]] && parent_dir="${file_path%/*}"
+    local encoded_dir="${parent_dir##*/}"
+    local decoded_path="${encoded_dir//-//}"
+    
+    # Strip the /Users/<name>/ home prefix, then any leading slash
+    case "$decoded_path" in
+        /Users/*/*) decoded_path="${decoded_path#/Users/}"; decoded_path="${decoded_path#*/}" ;;
+    esac
+    echo "${decoded_path#/}"
 }
 
 # Function to send enhanced notification
@@ -123,16 +202,18 @@ send_notification() {
     local group_prefix="$5"
     
     local group_id="${group_prefix}-$(date +%s)"
-    local cmd="\"$CLAUDE_NOTIFICATIONS_TERMINAL_NOTIFIER_PATH\" -group \"$group_id\" -title \"$title\" -subtitle \"$subtitle\" -message \"$message\" -sound \"Hero\" -ignoreDnD"
+    # Build argv directly rather than a string for eval: no second parse,
+    # and quotes or $(...) in titles/messages are passed through literally
+    local cmd=("$CLAUDE_NOTIFICATIONS_TERMINAL_NOTIFIER_PATH" -group "$group_id" -title "$title" -subtitle "$subtitle" -message "$message" -sound "Hero" -ignoreDnD)
     
     if [[ -n "$bundle_id" ]]; then
-        cmd="$cmd -activate \"$bundle_id\""
+        cmd+=(-activate "$bundle_id")
     fi
     
-    log_message "COMMAND" "Running: $cmd"
+    log_debug "COMMAND" "Running: ${cmd[*]}"
     
-    local output=$(eval "$cmd" 2>&1)
-    log_message "OUTPUT" "terminal-notifier output: $output"
+    local output=$("${cmd[@]}" 2>&1)
+    log_debug "OUTPUT" "terminal-notifier output: $output"
     
     if [[ -n "$bundle_id" ]]; then
         log_message "SUCCESS" "Sent notification with bundle ID: $bundle_id"
@@ -158,8 +239,30 @@ is_app_in_front() {
 # Function to check if notification should be sent
 should_notify() {
     local originating_app="$1"
+    local focused_app="$2"
+    
+    # Reuse the focused app the caller already looked up instead of
+    # querying lsappinfo a second time
+    if [[ -n "$focused_app" ]]; then
+        [[ "$originating_app" == "unknown" || "$focused_app" != "$originating_app" ]]
+        return
+    fi
+    
     ! is_app_in_front "$originating_app"
 }
 
-# Export all functions
-export -f log_message detect_originating_app get_bundle_id get_focused_app extract_project_name send_notification should_notify is_app_in_front
\ No newline at end of file
+# Function to send a notification unless the user is still in the originating app
+notify_if_switched_away() {
+    local originating_app="$1"
+    local focused_app="$2"
+    local title="$3"
+    local subtitle="$4"
+    local message="$5"
+    local group_prefix="$6"
+    
+    if should_notify "$originating_app" "$focused_app"; then
+        send_notification "$title" "$subtitle" "$message" "$(get_bundle_id "$originating_app")" "$group_prefix"
+    else
+        log_message "SKIPPED" "User still focused on originating app - no notification sent"
+    fi
+}
\ No newline at end of file
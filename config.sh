@@ -13,12 +13,21 @@ CLAUDE_NOTIFICATIONS_LOG_FILE="$CLAUDE_NOTIFICATIONS_DIR/debug.log"
 CLAUDE_NOTIFICATIONS_MAX_LOG_LINES=10000  # Maximum lines before rotation
 CLAUDE_NOTIFICATIONS_KEEP_LOG_LINES=5000  # Lines to keep after rotation
 
+# Debug logging (input JSON, app analysis, notifier commands); set to false
+# to log only the send/skip outcome of each hook
+CLAUDE_NOTIFICATIONS_DEBUG="${CLAUDE_NOTIFICATIONS_DEBUG:-true}"
+
+# Originating app cache: detection result reused for the same session
+CLAUDE_NOTIFICATIONS_APP_CACHE_FILE="$CLAUDE_NOTIFICATIONS_DIR/app-cache"
+CLAUDE_NOTIFICATIONS_APP_CACHE_TTL=300  # Seconds before the process tree is walked again
+
 # Claude settings file
 CLAUDE_NOTIFICATIONS_SETTINGS_FILE="$HOME/.claude/settings.json"
 
 # Terminal notifier path (try common locations)
-if command -v terminal-notifier &> /dev/null; then
-    CLAUDE_NOTIFICATIONS_TERMINAL_NOTIFIER_PATH=$(which terminal-notifier)
+# command -v resolves the path itself, so reuse its output rather than forking which
+if CLAUDE_NOTIFICATIONS_TERMINAL_NOTIFIER_PATH=$(command -v terminal-notifier 2>/dev/null); then
+    :
 elif [[ -f "/opt/homebrew/bin/terminal-notifier" ]]; then
     CLAUDE_NOTIFICATIONS_TERMINAL_NOTIFIER_PATH="/opt/homebrew/bin/terminal-notifier"
 elif [[ -f "/usr/local/bin/terminal-notifier" ]]; then
@@ -32,6 +41,9 @@ export CLAUDE_NOTIFICATIONS_DIR
 export CLAUDE_NOTIFICATIONS_LOG_FILE
 export CLAUDE_NOTIFICATIONS_MAX_LOG_LINES
 export CLAUDE_NOTIFICATIONS_KEEP_LOG_LINES
+export CLAUDE_NOTIFICATIONS_DEBUG
+export CLAUDE_NOTIFICATIONS_APP_CACHE_FILE
+export CLAUDE_NOTIFICATIONS_APP_CACHE_TTL
 export CLAUDE_NOTIFICATIONS_SETTINGS_FILE
 export CLAUDE_NOTIFICATIONS_TERMINAL_NOTIFIER_PATH
 
@@ -48,7 +60,4 @@ get_script_dir() {
 }
 
 # Ensure log directory exists
-mkdir -p "$(dirname "$LOG_FILE")"
-
-# Export the function
-export -f get_script_dir
\ No newline at end of file
+mkdir -p "$(dirname "$CLAUDE_NOTIFICATIONS_LOG_FILE")"
\ No newline at end of file
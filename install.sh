@@ -5,9 +5,13 @@
 
 set -e
 
-# Default installation directory (can be overridden by environment variable)
-INSTALL_DIR="${CLAUDE_NOTIFICATIONS_DIR:-$HOME/.claude-notifications}"
-CLAUDE_SETTINGS="$HOME/.claude/settings.json"
+# Get the directory where this install script is located
+SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
+
+# Installation paths come from config.sh (CLAUDE_NOTIFICATIONS_DIR overrides the default)
+source "$SCRIPT_DIR/config.sh"
+INSTALL_DIR="$CLAUDE_NOTIFICATIONS_DIR"
+CLAUDE_SETTINGS="$CLAUDE_NOTIFICATIONS_SETTINGS_FILE"
 
 echo "🚀 Installing Claude Code Enhanced Notification System..."
 echo "📁 Installation directory: $INSTALL_DIR"
@@ -41,9 +45,6 @@ echo "✅ Dependencies check complete"
 echo "🔧 Setting up installation directory..."
 mkdir -p "$INSTALL_DIR"
 
-# Get the directory where this install script is located
-SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
-
 # Copy scripts to installation directory (if not already there)
 if [[ "$SCRIPT_DIR" != "$INSTALL_DIR" ]]; then
     echo "📋 Copying scripts to $INSTALL_DIR..."
@@ -64,12 +65,9 @@ if [[ ! -f "$CLAUDE_SETTINGS" ]]; then
     mkdir -p "$(dirname "$CLAUDE_SETTINGS")"
 fi
 
-# Check if hooks are already configured
-if [[ -f "$CLAUDE_SETTINGS" ]] && jq -e '.hooks' "$CLAUDE_SETTINGS" &> /dev/null; then
-    echo "⚠️  Claude hooks already configured. Please manually add the following to your settings.json:"
-    echo ""
-    # Convert absolute path to relative path for display
-    RELATIVE_INSTALL_DIR=$(echo "$INSTALL_DIR" | sed "s|$HOME|~|")
+# Hooks configuration, shown to the user or written to settings.json (relative paths)
+RELATIVE_INSTALL_DIR=$(echo "$INSTALL_DIR" | sed "s|$HOME|~|")
+print_hooks_config() {
     cat << EOF
 "hooks": {
   "Notification": [
@@ -96,40 +94,23 @@ if [[ -f "$CLAUDE_SETTINGS" ]] && jq -e '.hooks' "$CLAUDE_SETTINGS" &> /dev/null
   ]
 }
 EOF
+}
+
+# Check if hooks are already configured
+if [[ -f "$CLAUDE_SETTINGS" ]] && jq -e '.hooks' "$CLAUDE_SETTINGS" &> /dev/null; then
+    echo "⚠️  Claude hooks already configured. Please manually add the following to your settings.json:"
+    echo ""
+    print_hooks_config
     echo ""
 else
     echo "⚙️  Configuring Claude hooks..."
     
-    # Create or update settings.json with relative paths
-    RELATIVE_INSTALL_DIR=$(echo "$INSTALL_DIR" | sed "s|$HOME|~|")
-    cat > "$CLAUDE_SETTINGS" << EOF
-{
-  "hooks": {
-    "Notification": [
-      {
-        "matcher": "",
-        "hooks": [
-          {
-            "type": "command",
-            "command": "$RELATIVE_INSTALL_DIR/notify-handler.sh"
-          }
-        ]
-      }
-    ],
-    "Stop": [
-      {
-        "matcher": "",
-        "hooks": [
-          {
-            "type": "command",
-            "command": "$RELATIVE_INSTALL_DIR/notify-completion.sh"
-          }
-        ]
-      }
-    ]
-  }
-}
-EOF
+    # Create or update settings.json
+    {
+        echo "{"
+        print_hooks_config | sed 's/^/  /'
+        echo "}"
+    } > "$CLAUDE_SETTINGS"
     echo "✅ Claude hooks configured"
 fi
 
@@ -143,7 +124,7 @@ echo "3. Get beautiful notifications when Claude finishes!"
 echo "4. Click notifications to return to your originating app"
 echo ""
 echo "🔍 Supported apps: IntelliJ IDEA, Cursor, VS Code, WebStorm, PyCharm, Terminal, iTerm, Ghostty, and more"
-echo "🐛 Debug logs: tail -f $INSTALL_DIR/debug.log"
+echo "🐛 Debug logs: tail -f $CLAUDE_NOTIFICATIONS_LOG_FILE"
 echo "📁 Installed at: $INSTALL_DIR"
 echo ""
 echo "Happy coding! 🚀"
\ No newline at end of file
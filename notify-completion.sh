@@ -11,34 +11,31 @@ source "$SCRIPT_DIR/common.sh"
 input=$(cat)
 
 # Log the hook trigger
-log_message "COMPLETION" "Input JSON: $input"
+log_debug "COMPLETION" "Input JSON: $input"
 
-# Extract data from JSON
-transcript_path=$(echo "$input" | jq -r '.transcript_path // "unknown"')
+# Extract data from JSON in a single jq pass (@sh quotes each value safely)
+eval "$(echo "$input" | jq -r '@sh "transcript_path=\(.transcript_path // "unknown") session_id=\(.session_id // "")"')"
 project_name=$(extract_project_name "$transcript_path")
-originating_app=$(detect_originating_app)
-focused_app=$(get_focused_app)
+
+# Look up the focused app in the background while the process tree is walked
+exec 3< <(get_focused_app)
+originating_app=$(get_originating_app "$session_id")
+read -r focused_app <&3
+exec 3<&-
 
 # Log extracted values
-log_message "ANALYSIS" "Project: $project_name | Originating: $originating_app | Focused: $focused_app"
+log_debug "ANALYSIS" "Project: $project_name | Originating: $originating_app | Focused: $focused_app"
 
-# Send notification only if user has switched away from the originating app
-if should_notify "$originating_app" "$focused_app"; then
-    bundle_id=$(get_bundle_id "$originating_app")
-    
-    # Prepare notification content
-    if [[ -n "$project_name" && "$project_name" != "unknown" ]]; then
-        message="Claude has finished running in $project_name"
-    else
-        message="Claude has finished running"
-    fi
-    
-    subtitle="Task completed from $originating_app"
-    
-    # Send the notification
-    send_notification "Claude Code" "$subtitle" "$message" "$bundle_id" "claude-completion"
+# Prepare notification content
+if [[ -n "$project_name" && "$project_name" != "unknown" ]]; then
+    message="Claude has finished running in $project_name"
 else
-    log_message "SKIPPED" "User still focused on originating app - no notification sent"
+    message="Claude has finished running"
 fi
 
+subtitle="Task completed from $originating_app"
+
+# Send notification only if user has switched away from the originating app
+notify_if_switched_away "$originating_app" "$focused_app" "Claude Code" "$subtitle" "$message" "claude-completion"
+
 exit 0
\ No newline at end of file
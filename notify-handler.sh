@@ -11,38 +11,33 @@ source "$SCRIPT_DIR/common.sh"
 input=$(cat)
 
 # Log the hook trigger
-log_message "NOTIFICATION" "Input JSON: $input"
+log_debug "NOTIFICATION" "Input JSON: $input"
 
-# Extract notification data
-title=$(echo "$input" | jq -r '.title // "Claude Code"')
-message=$(echo "$input" | jq -r '.message // "Notification"')
-transcript_path=$(echo "$input" | jq -r '.transcript_path // "unknown"')
+# Extract notification data in a single jq pass (@sh quotes each value safely)
+eval "$(echo "$input" | jq -r '@sh "title=\(.title // "Claude Code") message=\(.message // "Notification") transcript_path=\(.transcript_path // "unknown") session_id=\(.session_id // "")"')"
 
 # Extract context
 project_name=$(extract_project_name "$transcript_path")
-originating_app=$(detect_originating_app)
-focused_app=$(get_focused_app)
+
+# Look up the focused app in the background while the process tree is walked
+exec 3< <(get_focused_app)
+originating_app=$(get_originating_app "$session_id")
+read -r focused_app <&3
+exec 3<&-
 
 # Log extracted values
-log_message "ANALYSIS" "Title: $title | Message: $message | Project: $project_name | Originating: $originating_app | Focused: $focused_app"
+log_debug "ANALYSIS" "Title: $title | Message: $message | Project: $project_name | Originating: $originating_app | Focused: $focused_app"
 
-# Send notification only if user has switched away from the originating app
-if should_notify "$originating_app" "$focused_app"; then
-    bundle_id=$(get_bundle_id "$originating_app")
-    
-    # Customize message to include project context
-    if [[ -n "$project_name" && "$project_name" != "unknown" ]]; then
-        custom_message="$message in $project_name"
-    else
-        custom_message="$message"
-    fi
-    
-    subtitle="From $originating_app"
-    
-    # Send the notification
-    send_notification "$title" "$subtitle" "$custom_message" "$bundle_id" "claude-notification"
+# Customize message to include project context
+if [[ -n "$project_name" && "$project_name" != "unknown" ]]; then
+    custom_message="$message in $project_name"
 else
-    log_message "SKIPPED" "User still focused on originating app - no notification sent"
+    custom_message="$message"
 fi
 
+subtitle="From $originating_app"
+
+# Send notification only if user has switched away from the originating app
+notify_if_switched_away "$originating_app" "$focused_app" "$title" "$subtitle" "$custom_message" "claude-notification"
+
 exit 0
\ No newline at end of file
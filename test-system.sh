@@ -74,11 +74,11 @@ echo "✅ Notification scripts executed (check logs for details)"
 
 # Test 5: Check log file
 echo "📋 Checking log file..."
-if [[ -f "$LOG_FILE" ]]; then
-    echo "✅ Log file created at: $LOG_FILE"
-    echo "📊 Log entries: $(wc -l < "$LOG_FILE")"
+if [[ -f "$CLAUDE_NOTIFICATIONS_LOG_FILE" ]]; then
+    echo "✅ Log file created at: $CLAUDE_NOTIFICATIONS_LOG_FILE"
+    echo "📊 Log entries: $(wc -l < "$CLAUDE_NOTIFICATIONS_LOG_FILE")"
 else
-    echo "❌ Log file not found at: $LOG_FILE"
+    echo "❌ Log file not found at: $CLAUDE_NOTIFICATIONS_LOG_FILE"
     exit 1
 fi
 
@@ -95,5 +95,5 @@ echo "2. Switch to another app while Claude is working"
 echo "3. Get notified when Claude finishes"
 echo "4. Click notifications to return to your app"
 echo ""
-echo "🔍 Debug logs: tail -f $LOG_FILE"
+echo "🔍 Debug logs: tail -f $CLAUDE_NOTIFICATIONS_LOG_FILE"
 echo "📁 Installation: $CLAUDE_NOTIFICATIONS_DIR"
\ No newline at end of file